@@ -0,0 +1,62 @@
+"""
+Backtest a registered predictor over stored history and report accuracy and throughput.
+
+Run from the backend directory:
+
+    python benchmarks/backtest.py [--predictor moving_average] [--horizon day]
+                                  [--symbols AAPL,MSFT] [--workers 4] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from services import backtest_service, prediction_service
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--predictor', default=prediction_service.DEFAULT_PREDICTOR,
+                        choices=sorted(prediction_service.PREDICTORS))
+    parser.add_argument('--horizon', default='day', choices=list(prediction_service.HORIZON_STEPS))
+    parser.add_argument('--symbols', help='comma-separated symbols (default: all stored)')
+    parser.add_argument('--lookback', type=int, default=prediction_service.LOOKBACK_DAYS)
+    parser.add_argument('--workers', type=int, help='process pool size (default: CPU count, 1 = inline)')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print raw JSON results')
+    args = parser.parse_args()
+
+    symbols = [s.strip() for s in args.symbols.split(',') if s.strip()] if args.symbols else None
+    report = backtest_service.run_backtest(
+        predictor=args.predictor, horizon=args.horizon, symbols=symbols,
+        lookback=args.lookback, workers=args.workers, seed=args.seed
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    window = report['window']
+    window_text = f"{window[0]}-{window[1]} days" if window else '-'
+    print(f"Predictor: {report['predictor']}  horizon: {report['horizon']}  window: {window_text}")
+    print(f"{'Symbol':<10} {'Predictions':>12} {'MAE':>10} {'MAPE %':>8} {'Direction %':>12} {'Ties':>8} {'Pred/s':>12}")
+    print('-' * 77)
+    rows = list(report['symbols'].items()) + [('ALL', report['overall'])]
+    for symbol, m in rows:
+        if m['predictions'] == 0:
+            print(f"{symbol:<10} {0:>12}")
+            continue
+        rate = m.get('predictions_per_second')
+        direction = f"{m['directional_accuracy']:.2f}" if m['directional_accuracy'] is not None else 'n/a'
+        print(f"{symbol:<10} {m['predictions']:>12} {m['mae']:>10.4f} {m['mape']:>8.2f} "
+              f"{direction:>12} {m['direction_ties']:>8} {rate if rate is not None else '':>12}")
+    if report['skipped']:
+        print(f"Skipped (not enough history): {', '.join(report['skipped'])}")
+    if report['missing']:
+        print(f"Missing (no stored history): {', '.join(report['missing'])}")
+
+    timing = report['timing']
+    print(f"\nLoad: {timing['load_seconds']:.3f}s  compute: {timing['compute_seconds']:.3f}s  "
+          f"throughput: {timing['predictions_per_second']} predictions/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Startup benchmark: import time, baseline RSS and heavy modules per process.
+
+Each scenario runs in a fresh interpreter so nothing is shared between
+measurements. Run from the backend directory:
+
+    python benchmarks/startup.py [--runs 5] [--json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('pandas', 'numpy', 'yfinance')
+
+# name -> code run in the child; its duration is the measured "startup"
+SCENARIOS = {
+    'data_access (CLI/worker)': 'import data_access',
+    'app boot': 'import wsgi',
+    'app + POST /login': (
+        'import wsgi\n'
+        'wsgi.app.test_client().post("/login", json={"email": "a@b.c", "password": "x"})'
+    ),
+    'app + GET /stock/data (stored read)': (
+        'import wsgi\n'
+        'response = wsgi.app.test_client().get("/stock/data/AAPL")\n'
+        'assert response.status_code == 200, response.status_code'
+    ),
+    'data_access.ingest (reference)': 'from data_access import ingest',
+}
+
+CHILD = r'''
+import json, sys, time
+sys.path.insert(0, {backend!r})
+start = time.perf_counter()
+exec(compile({code!r}, '<scenario>', 'exec'))
+elapsed = time.perf_counter() - start
+
+rss_kb = None
+try:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                rss_kb = int(line.split()[1])
+except OSError:
+    import resource
+    rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        rss_kb //= 1024
+
+print(json.dumps({{
+    'elapsed': elapsed,
+    'rss_kb': rss_kb,
+    'heavy': [m for m in {heavy!r} if m in sys.modules],
+}}))
+'''
+
+def _run_child(code, env):
+    script = CHILD.format(backend=BACKEND_DIR, code=code, heavy=HEAVY_MODULES)
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip())
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result['wall'] = wall
+    return result
+
+def _prepare_database(env):
+    """Create the tables and store some AAPL history so the read scenario returns real rows"""
+    code = (
+        'import wsgi, data_access\n'
+        'from datetime import date, timedelta\n'
+        'from database import db\n'
+        'with wsgi.app.app_context():\n'
+        '    db.create_all()\n'
+        '    data_access.create_all()\n'
+        '    with data_access.session_scope("AAPL") as session:\n'
+        '        for i in range(120):\n'
+        '            price = 100.0 + i\n'
+        '            session.add(data_access.StockData(\n'
+        '                company_symbol="AAPL", date=date.today() - timedelta(days=120 - i),\n'
+        '                open_price=price, high_price=price + 1, low_price=price - 1,\n'
+        '                close_price=price, volume=1000000))\n'
+    )
+    _run_child(code, env)
+
+def run(runs=5):
+    """
+    Measure every scenario
+    Args:
+        runs (int): Fresh processes per scenario
+    Returns:
+        dict: Scenario name -> median import seconds, process seconds, RSS (MB) and heavy modules
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ)
+        env['DATABASE_URL'] = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        env['FETCH_CACHE_DIR'] = os.path.join(tmp, 'fetch_cache')
+        _prepare_database(env)
+
+        for name, code in SCENARIOS.items():
+            samples = [_run_child(code, env) for _ in range(runs)]
+            results[name] = {
+                'import_s': statistics.median(s['elapsed'] for s in samples),
+                'process_s': statistics.median(s['wall'] for s in samples),
+                'rss_mb': statistics.median(s['rss_kb'] for s in samples) / 1024,
+                'heavy_modules': samples[-1]['heavy'],
+            }
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per scenario')
+    parser.add_argument('--json', action='store_true', help='print raw JSON results')
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'Scenario':<38} {'Import':>9} {'Process':>9} {'RSS':>9}  Heavy modules loaded")
+    print('-' * 90)
+    for name, r in results.items():
+        heavy = ', '.join(r['heavy_modules']) or '-'
+        print(f"{name:<38} {r['import_s'] * 1000:>7.0f}ms {r['process_s'] * 1000:>7.0f}ms "
+              f"{r['rss_mb']:>7.1f}MB  {heavy}")
+
+if __name__ == '__main__':
+    main()
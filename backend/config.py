@@ -1,6 +1,28 @@
 import os
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'ABC'  # Replace with a strong, actual secret key
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL') or 'sqlite:///site.db'  # Use your preferred database URI
-    SQLALCHEMY_TRACK_MODIFICATIONS = False
\ No newline at end of file
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Read replicas for read-only data-layer queries (comma-separated URLs; empty = primary only)
+    DATABASE_REPLICA_URLS = [u.strip() for u in (os.environ.get('DATABASE_REPLICA_URLS') or '').split(',') if u.strip()]
+    # After a write, reads of the same symbol stay on the primary this long (replication lag budget)
+    REPLICA_READ_AFTER_WRITE_SECONDS = float(os.environ.get('REPLICA_READ_AFTER_WRITE_SECONDS') or 5)
+
+    # On-disk cache of raw Yahoo Finance responses (see data_access/fetch_cache.py)
+    # FETCH_CACHE_MODE: 'live' (use + fill the cache), 'replay' (offline, cache only) or 'off'
+    FETCH_CACHE_MODE = os.environ.get('FETCH_CACHE_MODE') or 'live'
+    FETCH_CACHE_DIR = os.environ.get('FETCH_CACHE_DIR') or os.path.join(BASE_DIR, 'instance', 'fetch_cache')
+    FETCH_CACHE_MAX_BYTES = int(os.environ.get('FETCH_CACHE_MAX_BYTES') or 256 * 1024 * 1024)
+    FETCH_CACHE_LIVE_TTL = int(os.environ.get('FETCH_CACHE_LIVE_TTL') or 15 * 60)  # range includes today
+    FETCH_CACHE_HISTORICAL_TTL = int(os.environ.get('FETCH_CACHE_HISTORICAL_TTL') or 7 * 24 * 3600)  # closed range
+
+    # Live price stream (see services/price_broker.py)
+    LIVE_STREAM_QUEUE_SIZE = int(os.environ.get('LIVE_STREAM_QUEUE_SIZE') or 100)  # messages buffered per client
+    LIVE_STREAM_KEEPALIVE = int(os.environ.get('LIVE_STREAM_KEEPALIVE') or 15)  # seconds between SSE comments
+    # Statistics windows a stream may ask for (the stock page's duration options);
+    # each distinct window costs one statistics query per ingest
+    LIVE_STREAM_DAYS = (30, 60, 90, 180, 365)
\ No newline at end of file
@@ -0,0 +1,9 @@
+# data_access: framework-independent data layer shared by the Flask app,
+# CLI tools and workers. Ingestion lives in data_access.ingest (it pulls in
+# pandas/yfinance), the raw response cache in data_access.fetch_cache.
+from data_access.models import Base, StockData
+from data_access.engine import (
+    DataLayer, configure, get_engine, get_session, get_read_session,
+    session_scope, mark_written, read_after_write, remove_session, create_all, init_app,
+)
+from data_access.queries import query_stock_data, query_close_history, list_symbols
@@ -0,0 +1,233 @@
+# data_access/engine.py
+"""
+Engines and session factories.
+
+Each web app gets its own DataLayer: init_app() builds one around the app's
+Flask-SQLAlchemy engine (so both use one connection pool) and stores it in
+app.extensions['data_access']. Inside an app context the functions below use
+that app's layer. Outside one (CLI tools, workers) they use a process-wide
+default layer that configure() binds, built from Config on first use without
+importing Flask.
+
+Read-only work can use get_read_session(), which goes to a read replica
+(Config.DATABASE_REPLICA_URLS, round-robin per session) when any are
+configured. Commits through session_scope(key) mark the key as written.
+For REPLICA_READ_AFTER_WRITE_SECONDS afterwards, reads for that key stay on
+the primary, so a caller reads its own writes while replicas catch up. That
+window is tracked per process. A read handled by another worker process
+learns about the write from the client instead: the web layer passes the
+write time the client was given to read_after_write(), which keeps reads of
+that key on the primary for the same window.
+"""
+import itertools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session as OrmSession, scoped_session, sessionmaker
+
+from config import Config, BASE_DIR
+from data_access.models import Base
+
+class ReplicaSession(OrmSession):
+    """Session pinned to one read replica for its lifetime; refuses to flush"""
+
+    def __init__(self, replicas=None, **kwargs):
+        super().__init__(**kwargs)
+        self._replicas = replicas
+        self._replica_bind = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._replica_bind is None:
+            self._replica_bind = next(self._replicas)
+        return self._replica_bind
+
+@event.listens_for(ReplicaSession, 'before_flush')
+def _refuse_replica_flush(session, flush_context, instances):
+    raise RuntimeError("Read-only session cannot write; use session_scope()")
+
+_ANY_KEY = object()
+# key -> wall-clock write time reported by the client, for the current request
+_client_writes = ContextVar('client_writes', default={})
+
+def _resolve_url(url):
+    """
+    Resolve relative SQLite paths against backend/instance, the same place
+    Flask-SQLAlchemy puts them, so the app and offline jobs share one file.
+    """
+    url = make_url(url)
+    if url.get_backend_name() == 'sqlite' and url.database and url.database != ':memory:' \
+            and not os.path.isabs(url.database):
+        instance_dir = os.path.join(BASE_DIR, 'instance')
+        os.makedirs(instance_dir, exist_ok=True)
+        url = url.set(database=os.path.join(instance_dir, url.database))
+    return url
+
+class DataLayer:
+    """A primary engine, its read replicas and the sessions bound to them"""
+
+    def __init__(self, url=None, engine=None, replica_urls=None, **engine_kwargs):
+        """
+        Args:
+            url (str): Database URL (defaults to Config.SQLALCHEMY_DATABASE_URI)
+            engine (Engine): Existing engine to reuse instead of creating one
+            replica_urls (list): Read replica URLs (defaults to Config.DATABASE_REPLICA_URLS)
+            **engine_kwargs: Extra arguments for sqlalchemy.create_engine
+        """
+        if engine is None:
+            engine = create_engine(_resolve_url(url or Config.SQLALCHEMY_DATABASE_URI), **engine_kwargs)
+        self.engine = engine
+        if replica_urls is None:
+            replica_urls = Config.DATABASE_REPLICA_URLS
+        self.replica_engines = [create_engine(_resolve_url(u), **engine_kwargs) for u in replica_urls]
+        replicas = itertools.cycle(self.replica_engines) if self.replica_engines else None
+
+        self.Session = scoped_session(sessionmaker(bind=self.engine))
+        self.ReadSession = scoped_session(
+            sessionmaker(class_=ReplicaSession, replicas=replicas, autoflush=False)
+        ) if replicas else None
+        self._last_writes = {}
+        self._last_writes_lock = threading.Lock()
+
+    def mark_written(self, key=None):
+        with self._last_writes_lock:
+            self._last_writes[_ANY_KEY if key is None else key] = time.monotonic()
+
+    def recently_written(self, key):
+        window = Config.REPLICA_READ_AFTER_WRITE_SECONDS
+        now = time.monotonic()
+        with self._last_writes_lock:
+            stamps = [self._last_writes.get(_ANY_KEY), self._last_writes.get(key) if key is not None else None]
+        if any(stamp is not None and now - stamp < window for stamp in stamps):
+            return True
+        # Written by another process: compare wall clocks, allowing for skew either way
+        written_at = _client_writes.get().get(key)
+        return written_at is not None and abs(time.time() - written_at) < window
+
+    def remove_session(self, exception=None):
+        """Release the current thread's sessions (used as a Flask teardown hook)"""
+        self.Session.remove()
+        if self.ReadSession is not None:
+            self.ReadSession.remove()
+
+    def dispose(self):
+        """Release sessions and close the replica pools (the primary may be shared)"""
+        self.remove_session()
+        for replica in self.replica_engines:
+            replica.dispose()
+
+_default = None
+
+def _current():
+    """The current app's layer inside a Flask app context, else the process-wide default"""
+    flask = sys.modules.get('flask')
+    if flask is not None and flask.has_app_context():
+        layer = flask.current_app.extensions.get('data_access')
+        if layer is not None:
+            return layer
+    if _default is None:
+        configure()
+    return _default
+
+def configure(url=None, engine=None, replica_urls=None, **engine_kwargs):
+    """
+    Bind the process-wide default layer (used outside app contexts)
+    Args:
+        url (str): Database URL (defaults to Config.SQLALCHEMY_DATABASE_URI)
+        engine (Engine): Existing engine to reuse instead of creating one
+        replica_urls (list): Read replica URLs (defaults to Config.DATABASE_REPLICA_URLS)
+        **engine_kwargs: Extra arguments for sqlalchemy.create_engine
+    Returns:
+        Engine: The primary engine now in use
+    """
+    global _default
+    if _default is not None:
+        _default.dispose()
+    _default = DataLayer(url, engine, replica_urls, **engine_kwargs)
+    return _default.engine
+
+def get_engine():
+    return _current().engine
+
+def get_session():
+    """Return the current thread's primary session, configuring the default layer on first use"""
+    return _current().Session()
+
+def mark_written(key=None):
+    """Keep reads for key (every key if None) on the primary for the read-after-write window"""
+    _current().mark_written(key)
+
+def get_read_session(key=None):
+    """
+    Return a session for read-only work
+    Args:
+        key (str): What is being read (e.g. a stock symbol), for read-your-writes
+    Returns:
+        Session: A replica session, or the primary session when no replicas
+                 are configured or key was written within the window
+    """
+    layer = _current()
+    if layer.ReadSession is None or layer.recently_written(key):
+        return layer.Session()
+    return layer.ReadSession()
+
+@contextmanager
+def read_after_write(writes):
+    """
+    Treat keys a client says it just wrote as recently written, for reads in this block
+    Args:
+        writes (dict): key -> Unix time of the write (e.g. from a response header)
+    """
+    token = _client_writes.set(dict(writes or {}))
+    try:
+        yield
+    finally:
+        _client_writes.reset(token)
+
+@contextmanager
+def session_scope(key=None):
+    """
+    Transactional scope on the primary: commit on success, roll back on error
+    Args:
+        key (str): What is being written; reads of it stay on the primary for a while
+    """
+    layer = _current()
+    session = layer.Session()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    layer.mark_written(key)
+
+def remove_session(exception=None):
+    """Release the current thread's sessions"""
+    _current().remove_session(exception)
+
+def create_all():
+    """Create the data-layer tables"""
+    Base.metadata.create_all(get_engine())
+
+def init_app(app, engine=None):
+    """
+    Give a web app its own data layer without depending on Flask itself
+    Args:
+        app: Object with extensions, config and teardown_appcontext() (e.g. a Flask app)
+        engine (Engine): Engine to share with the app, if it already has one
+    Returns:
+        DataLayer: The app's layer
+    """
+    layer = DataLayer(
+        url=app.config.get('SQLALCHEMY_DATABASE_URI'),
+        engine=engine,
+        replica_urls=app.config.get('DATABASE_REPLICA_URLS')
+    )
+    app.extensions['data_access'] = layer
+    app.teardown_appcontext(layer.remove_session)
+    return layer
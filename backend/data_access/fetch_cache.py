@@ -0,0 +1,305 @@
+# data_access/fetch_cache.py
+"""
+On-disk cache of raw upstream (Yahoo Finance) responses.
+
+Entries are addressed by the SHA-256 of (symbol, start, end, interval) and
+stored as pickles under Config.FETCH_CACHE_DIR/<interval>/<symbol>/, with
+the range in the file name. Ranges that include the day the response was
+fetched expire after FETCH_CACHE_LIVE_TTL, closed ranges after
+FETCH_CACHE_HISTORICAL_TTL. The directory is kept under
+FETCH_CACHE_MAX_BYTES by evicting least recently used entries.
+
+With FETCH_CACHE_MODE='replay' nothing expires and misses are not forwarded
+upstream, so ingestion and benchmarks can run fully offline from previously
+recorded responses. Replay does not depend on the wall clock: a request is
+served from the latest recording for its symbol/interval whose range covers
+the requested one, trimmed to [start, end) so it sees exactly the rows the
+live request would have. A recording that only partly covers the range is a
+miss.
+"""
+import hashlib
+import json
+import os
+import pickle
+import re
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+
+from config import Config
+
+MODE_LIVE = 'live'
+MODE_REPLAY = 'replay'
+MODE_OFF = 'off'
+
+# Bytes the cache directory is believed to hold; rescanned on first use and
+# whenever FETCH_CACHE_DIR changes
+_size_estimate = None
+_size_dir = None
+_size_lock = threading.Lock()
+
+def _normalize_date(value):
+    """Reduce a date/datetime/string to an ISO date string"""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+def cache_key(symbol, start, end, interval='1d'):
+    """
+    Build the content address for a provider request
+    Args:
+        symbol (str): Stock symbol
+        start (date): Range start (inclusive)
+        end (date): Range end (exclusive, as passed to yfinance)
+        interval (str): Bar interval
+    Returns:
+        str: Hex digest identifying the request
+    """
+    raw = json.dumps([symbol.upper(), _normalize_date(start), _normalize_date(end), interval])
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+def _safe_name(value):
+    return re.sub(r'[^A-Za-z0-9._^=-]', '_', value)
+
+def _symbol_dir(symbol, interval):
+    return os.path.join(Config.FETCH_CACHE_DIR, _safe_name(interval), _safe_name(symbol.upper()))
+
+def _entry_path(symbol, start, end, interval):
+    start, end = _normalize_date(start), _normalize_date(end)
+    name = f"{start}_{end}_{cache_key(symbol, start, end, interval)}.pkl"
+    return os.path.join(_symbol_dir(symbol, interval), name)
+
+def get_mode():
+    return (Config.FETCH_CACHE_MODE or MODE_LIVE).lower()
+
+def is_replay():
+    return get_mode() == MODE_REPLAY
+
+def _is_fresh(entry, now):
+    fetched_at = entry['fetched_at']
+    fetched_day = datetime.fromtimestamp(fetched_at).date().isoformat()
+    # end is exclusive, so the range covered the fetch day if end > that day
+    includes_fetch_day = entry['end'] > fetched_day
+    ttl = Config.FETCH_CACHE_LIVE_TTL if includes_fetch_day else Config.FETCH_CACHE_HISTORICAL_TTL
+    return now - fetched_at < ttl
+
+def _load(path):
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Discarding unreadable cache entry {path}: {e}")
+        _remove(path)
+        return None
+
+def _touch(path, now):
+    """Mark the entry as recently used for LRU eviction"""
+    try:
+        os.utime(path, (now, now))
+    except OSError:
+        pass
+
+def _find_recording(symbol, start, end, interval):
+    """Latest recorded entry for symbol/interval whose range covers [start, end)"""
+    directory = _symbol_dir(symbol, interval)
+    start, end = _normalize_date(start), _normalize_date(end)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+
+    best = None
+    for name in names:
+        parts = name.split('_')
+        if not name.endswith('.pkl') or len(parts) != 3:
+            continue
+        entry_start, entry_end = parts[0], parts[1]
+        if entry_start <= start and entry_end >= end and (best is None or entry_end > best[0]):
+            best = (entry_end, os.path.join(directory, name))
+    return best[1] if best else None
+
+def _trim_to_range(data, start, end):
+    """Keep rows in [start, end) of a DataFrame indexed by date (other objects pass through)"""
+    index = getattr(data, 'index', None)
+    if index is None or not hasattr(index, 'tz'):
+        return data
+    import pandas as pd
+    lower = pd.Timestamp(_normalize_date(start))
+    upper = pd.Timestamp(_normalize_date(end))
+    if index.tz is not None:
+        lower, upper = lower.tz_localize(index.tz), upper.tz_localize(index.tz)
+    return data[(index >= lower) & (index < upper)]
+
+def get(symbol, start, end, interval='1d'):
+    """
+    Look up a cached provider response
+    Args:
+        symbol (str): Stock symbol
+        start (date): Range start
+        end (date): Range end (exclusive)
+        interval (str): Bar interval
+    Returns:
+        object: Cached response, or None on miss/expiry
+    """
+    mode = get_mode()
+    if mode == MODE_OFF:
+        return None
+
+    now = time.time()
+    if mode == MODE_REPLAY:
+        path = _find_recording(symbol, start, end, interval)
+        entry = _load(path) if path else None
+        if entry is None:
+            return None
+        _touch(path, now)
+        return _trim_to_range(entry['data'], start, end)
+
+    path = _entry_path(symbol, start, end, interval)
+    entry = _load(path)
+    if entry is None or not _is_fresh(entry, now):
+        return None
+    _touch(path, now)
+    return entry['data']
+
+def put(symbol, start, end, data, interval='1d'):
+    """
+    Record a provider response
+    Args:
+        symbol (str): Stock symbol
+        start (date): Range start
+        end (date): Range end (exclusive)
+        data (object): Picklable provider response (usually a DataFrame)
+        interval (str): Bar interval
+    Returns:
+        bool: True if stored, False otherwise
+    """
+    if get_mode() == MODE_OFF:
+        return False
+
+    path = _entry_path(symbol, start, end, interval)
+    entry = {
+        'symbol': symbol.upper(),
+        'start': _normalize_date(start),
+        'end': _normalize_date(end),
+        'interval': interval,
+        'fetched_at': time.time(),
+        'data': data,
+    }
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            old_size = os.path.getsize(path)
+        except OSError:
+            old_size = 0
+        # Write to a temp file and rename so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        size = os.path.getsize(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"Error writing cache entry for {symbol}: {e}")
+        if tmp_path is not None:
+            _remove(tmp_path)
+        return False
+
+    _account(size - old_size)
+    return True
+
+def _account(delta):
+    """Track the cache size and evict only once it is over budget"""
+    global _size_estimate, _size_dir
+    with _size_lock:
+        if _size_estimate is None or _size_dir != Config.FETCH_CACHE_DIR:
+            _size_dir = Config.FETCH_CACHE_DIR
+            _size_estimate = sum(size for _, size, _ in _iter_entries())
+        else:
+            _size_estimate += delta
+        over_budget = _size_estimate > Config.FETCH_CACHE_MAX_BYTES
+    if over_budget:
+        evict(Config.FETCH_CACHE_MAX_BYTES)
+
+def fetch(symbol, start, end, loader, interval='1d'):
+    """
+    Return a cached response or call loader() and record its result
+    Args:
+        symbol (str): Stock symbol
+        start (date): Range start
+        end (date): Range end (exclusive)
+        loader (callable): Performs the upstream request; returns None on failure
+        interval (str): Bar interval
+    Returns:
+        object: Provider response or None
+    """
+    data = get(symbol, start, end, interval)
+    if data is not None:
+        return data
+
+    if is_replay():
+        print(f"Replay mode: no recorded response for {symbol} covering "
+              f"{_normalize_date(start)} to {_normalize_date(end)}")
+        return None
+
+    data = loader()
+    if data is not None and not getattr(data, 'empty', False):
+        put(symbol, start, end, data, interval)
+    return data
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _iter_entries():
+    root = Config.FETCH_CACHE_DIR
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith('.pkl'):
+                path = os.path.join(directory, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+def evict(max_bytes):
+    """
+    Remove least recently used entries until the cache fits in max_bytes
+    Args:
+        max_bytes (int): Size budget for the cache directory
+    Returns:
+        int: Number of entries removed
+    """
+    global _size_estimate, _size_dir
+    entries = list(_iter_entries())
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for path, size, _ in sorted(entries, key=lambda e: e[2]):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+        removed += 1
+
+    # Resynchronise with disk (other processes may share the directory)
+    with _size_lock:
+        _size_dir = Config.FETCH_CACHE_DIR
+        _size_estimate = total
+    return removed
+
+def clear():
+    """Remove every cached entry"""
+    global _size_estimate, _size_dir
+    for path, _, _ in list(_iter_entries()):
+        _remove(path)
+    with _size_lock:
+        _size_dir = Config.FETCH_CACHE_DIR
+        _size_estimate = 0
@@ -0,0 +1,173 @@
+# data_access/ingest.py
+"""
+Fetching daily history from Yahoo Finance and storing it in stock_data.
+"""
+import math
+from datetime import datetime, timedelta
+
+import pandas as pd
+from sqlalchemy.dialects import postgresql, sqlite
+
+from data_access import fetch_cache
+from data_access.models import StockData
+
+PRICE_COLUMNS = {
+    'Open': 'open_price',
+    'High': 'high_price',
+    'Low': 'low_price',
+    'Close': 'close_price',
+}
+VALUE_COLUMNS = list(PRICE_COLUMNS.values()) + ['volume']
+
+# Dialects with native INSERT ... ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+def _download_history(company_symbol, start_date, end_date, validate):
+    """Optionally validate the ticker, then download its daily history"""
+    # Imported here so cache hits and replay runs never load yfinance
+    import yfinance as yf
+
+    # Use yfinance Ticker for better error handling
+    ticker = yf.Ticker(company_symbol)
+
+    # Check if ticker is valid by trying to get info
+    if validate:
+        try:
+            info = ticker.info
+            if not info or info.get('regularMarketPrice') is None:
+                print(f"Invalid ticker symbol: {company_symbol}")
+                return None
+        except Exception as e:
+            print(f"Error validating ticker {company_symbol}: {e}")
+            return None
+
+    return ticker.history(start=start_date, end=end_date)
+
+def fetch_history(company_symbol, months=3, validate=True):
+    """
+    Fetch historical stock data, going through the upstream fetch cache
+    Args:
+        company_symbol (str): Stock symbol (e.g., 'AAPL')
+        months (int): Number of months of historical data to fetch
+        validate (bool): Check the ticker via Ticker.info before downloading
+    Returns:
+        pandas.DataFrame: Historical stock data (NaN rows dropped) or None if error
+    """
+    try:
+        # Whole-day bounds so identical requests share a cache entry; end is
+        # exclusive in yfinance, so use tomorrow to keep today's bar.
+        end_date = datetime.now().date() + timedelta(days=1)
+        start_date = end_date - timedelta(days=months * 30 + 1)
+
+        data = fetch_cache.fetch(
+            company_symbol, start_date, end_date,
+            lambda: _download_history(company_symbol, start_date, end_date, validate)
+        )
+
+        if data is None or data.empty:
+            print(f"No data found for symbol: {company_symbol}")
+            return None
+
+        # Clean the data
+        data = data.dropna()  # Remove any rows with NaN values
+
+        print(f"Successfully fetched {len(data)} records for {company_symbol}")
+        return data
+
+    except Exception as e:
+        print(f"Error fetching historical data for {company_symbol}: {e}")
+        return None
+
+def _to_optional(values, cast):
+    return [None if math.isnan(v) else cast(v) for v in values]
+
+def clean_history(company_symbol, data):
+    """
+    Convert a yfinance history frame into stock_data rows
+    Args:
+        company_symbol (str): Stock symbol
+        data (pandas.DataFrame): Frame indexed by date with Open/High/Low/Close/Volume
+    Returns:
+        list: Row dicts, one per date; prices rounded to 2 places, rows
+              without any price dropped, later duplicates of a date win
+    """
+    if data is None or data.empty:
+        return []
+
+    frame = data.reindex(columns=list(PRICE_COLUMNS) + ['Volume'])
+    prices = frame[list(PRICE_COLUMNS)].apply(pd.to_numeric, errors='coerce').round(2)
+    keep = prices.notna().any(axis=1).to_numpy()
+
+    prices = prices[keep]
+    volumes = pd.to_numeric(frame['Volume'], errors='coerce')[keep]
+    dates = pd.DatetimeIndex(frame.index[keep]).date
+
+    columns = {dest: _to_optional(prices[src].tolist(), float) for src, dest in PRICE_COLUMNS.items()}
+    columns['volume'] = _to_optional(volumes.tolist(), int)
+
+    rows = {}
+    for i, day in enumerate(dates):
+        row = {'company_symbol': company_symbol, 'date': day}
+        for name in VALUE_COLUMNS:
+            row[name] = columns[name][i]
+        rows[day] = row
+    return list(rows.values())
+
+def upsert_stock_data(session, company_symbol, data):
+    """
+    Insert new rows and update changed ones, one round-trip per statement
+    Args:
+        session (Session): SQLAlchemy session; the caller commits
+        company_symbol (str): Stock symbol
+        data (pandas.DataFrame): yfinance history frame
+    Returns:
+        tuple: (records_added, records_updated, written_rows) where
+               written_rows are the row dicts actually inserted or changed
+               (rows identical to what is stored are skipped)
+    """
+    rows = clean_history(company_symbol, data)
+    if not rows:
+        return 0, 0, []
+
+    dates = [row['date'] for row in rows]
+    existing = {
+        stored[0]: stored[1:]
+        for stored in session.query(StockData.date, StockData.id,
+                                    *[getattr(StockData, name) for name in VALUE_COLUMNS])
+        .filter(StockData.company_symbol == company_symbol,
+                StockData.date >= min(dates),
+                StockData.date <= max(dates))
+        .all()
+    }
+
+    new_rows = []
+    changed_rows = []
+    for row in rows:
+        stored = existing.get(row['date'])
+        if stored is None:
+            new_rows.append(row)
+        elif tuple(stored[1:]) != tuple(row[name] for name in VALUE_COLUMNS):
+            changed_rows.append(row)
+
+    written_rows = sorted(new_rows + changed_rows, key=lambda row: row['date'])
+    if not written_rows:
+        return 0, 0, []
+    now = datetime.utcnow()
+
+    insert = _UPSERT_INSERTS.get(session.get_bind().dialect.name)
+    if insert is not None:
+        stmt = insert(StockData.__table__)
+        update_values = {name: getattr(stmt.excluded, name) for name in VALUE_COLUMNS}
+        update_values['updated_at'] = now
+        stmt = stmt.on_conflict_do_update(index_elements=['company_symbol', 'date'], set_=update_values)
+        session.execute(stmt, written_rows)
+    else:
+        session.bulk_insert_mappings(StockData, new_rows)
+        session.bulk_update_mappings(StockData, [
+            dict(row, id=existing[row['date']][0], updated_at=now) for row in changed_rows
+        ])
+
+    return len(new_rows), len(changed_rows), written_rows
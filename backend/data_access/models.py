@@ -0,0 +1,45 @@
+# data_access/models.py
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, Float, BigInteger, Date, DateTime, Index, UniqueConstraint
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
+
+class StockData(Base):
+    __tablename__ = 'stock_data'
+
+    id = Column(Integer, primary_key=True)
+    company_symbol = Column(String(10), nullable=False, index=True)
+    date = Column(Date, nullable=False, index=True)
+    open_price = Column(Float)
+    high_price = Column(Float)
+    low_price = Column(Float)
+    close_price = Column(Float)
+    volume = Column(BigInteger)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Composite index for better query performance
+    __table_args__ = (
+        Index('idx_symbol_date', 'company_symbol', 'date'),
+        UniqueConstraint('company_symbol', 'date', name='uq_symbol_date')
+    )
+
+    def to_dict(self):
+        """Convert model instance to dictionary"""
+        return {
+            'id': self.id,
+            'company_symbol': self.company_symbol,
+            'date': self.date.strftime('%Y-%m-%d') if self.date else None,
+            'open_price': self.open_price,
+            'high_price': self.high_price,
+            'low_price': self.low_price,
+            'close_price': self.close_price,
+            'volume': self.volume,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+    def __repr__(self):
+        return f'<StockData {self.company_symbol} {self.date} ${self.close_price}>'
@@ -0,0 +1,55 @@
+# data_access/queries.py
+from data_access.models import StockData
+
+def query_stock_data(session, company_symbol, start_date=None, end_date=None, limit=None, newest_first=True):
+    """
+    Retrieve stored stock data
+    Args:
+        session (Session): SQLAlchemy session
+        company_symbol (str): Stock symbol
+        start_date (date): Start date filter (optional)
+        end_date (date): End date filter (optional)
+        limit (int): Maximum number of records to return (optional)
+        newest_first (bool): Order by date descending; otherwise insertion order
+    Returns:
+        list: List of StockData objects
+    """
+    query = session.query(StockData).filter(StockData.company_symbol == company_symbol)
+
+    if start_date:
+        query = query.filter(StockData.date >= start_date)
+    if end_date:
+        query = query.filter(StockData.date <= end_date)
+
+    query = query.order_by(StockData.date.desc() if newest_first else StockData.id)
+
+    if limit:
+        query = query.limit(limit)
+
+    return query.all()
+
+def list_symbols(session):
+    """Return every symbol that has stored data"""
+    return [row[0] for row in session.query(StockData.company_symbol).distinct().all()]
+
+def query_close_history(session, symbols=None):
+    """
+    Load chronological closing prices for many symbols in a single query
+    Args:
+        session (Session): SQLAlchemy session
+        symbols (list): Symbols to load (optional, default all)
+    Returns:
+        dict: symbol -> (list of dates, list of close prices), oldest first
+    """
+    query = session.query(StockData.company_symbol, StockData.date, StockData.close_price) \
+        .filter(StockData.close_price.isnot(None))
+    if symbols:
+        query = query.filter(StockData.company_symbol.in_(symbols))
+    query = query.order_by(StockData.company_symbol, StockData.date)
+
+    histories = {}
+    for symbol, day, close in query.yield_per(10000):
+        dates, closes = histories.setdefault(symbol, ([], []))
+        dates.append(day)
+        closes.append(close)
+    return histories
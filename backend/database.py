@@ -1,7 +1,12 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask import Flask
 
+import data_access
+
 db = SQLAlchemy()
 
 def init_app(app: Flask):
-    db.init_app(app)
\ No newline at end of file
+    db.init_app(app)
+    # Give the app its own data layer sharing Flask-SQLAlchemy's engine (and pool)
+    with app.app_context():
+        data_access.init_app(app, engine=db.engine)
\ No newline at end of file
@@ -0,0 +1 @@
+# resources: Flask blueprints registered by app.create_app()
\ No newline at end of file
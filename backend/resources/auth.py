@@ -0,0 +1,27 @@
+from flask import Blueprint, request, jsonify
+from services import auth_service
+
+auth_bp = Blueprint('auth', __name__)
+
+@auth_bp.route('/signup', methods=['POST'])
+def register():
+    data = request.get_json()
+    username = data.get('username')
+    email = data.get('email')
+    password = data.get('password')
+
+    if not username or not email or not password:
+        return jsonify({'success': False, 'message': 'Missing required fields'}), 400
+
+    return auth_service.register_user(username, email, password)
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    data = request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+
+    if not email or not password:
+        return jsonify({'success': False, 'message': 'Missing email or password'}), 400
+
+    return auth_service.login_user(email, password)
\ No newline at end of file
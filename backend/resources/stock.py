@@ -0,0 +1,111 @@
+import time
+from functools import wraps
+
+from flask import Blueprint, Response, current_app, request, jsonify
+
+import data_access
+from services import data_services, prediction_service, price_broker
+
+stock_bp = Blueprint('stock', __name__)
+
+# Returned by /stock/fetch as "<symbol>=<unix time>" and sent back by the client
+# on its next reads, so whichever worker serves them reads its own write
+WRITE_MARKER_HEADER = 'X-Stock-Written'
+
+def _client_writes():
+    """Parse the write marker header into symbol -> write time (malformed entries are ignored)"""
+    writes = {}
+    for item in request.headers.get(WRITE_MARKER_HEADER, '').split(','):
+        symbol, _, written_at = item.strip().rpartition('=')
+        try:
+            writes[symbol] = float(written_at)
+        except ValueError:
+            continue
+    return writes
+
+def reads_client_writes(view):
+    """Serve the view's stored-data reads from the primary if the client just wrote them"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with data_access.read_after_write(_client_writes()):
+            return view(*args, **kwargs)
+    return wrapper
+
+@stock_bp.route('/stock/fetch', methods=['POST'])
+def fetch_and_store_stock():
+    data = request.get_json()
+    symbol = data.get('symbol')
+    months = int(data.get('months', 3))
+    if not symbol:
+        return jsonify({'success': False, 'message': 'Missing symbol'}), 400
+
+    df = data_services.get_historical_data(symbol, months)
+    if df is None or df.empty:
+        return jsonify({'success': False, 'message': 'Failed to fetch data'}), 404
+
+    stored = data_services.store_stock_data(symbol, df)
+    stats = data_services.get_stock_statistics(symbol, days=months*30)
+    response = jsonify({'success': stored, 'data': {'statistics': stats}})
+    if stored:
+        response.headers[WRITE_MARKER_HEADER] = f'{symbol}={time.time():.3f}'
+    return response
+
+@stock_bp.route('/stock/data/<symbol>', methods=['GET'])
+@reads_client_writes
+def get_stock_data(symbol):
+    limit = int(request.args.get('limit', 90))
+    days = int(request.args.get('days', 90))
+    records = data_services.get_stored_stock_data(symbol, limit=limit)
+    stats = data_services.get_stock_statistics(symbol, days=days)
+    if not records:
+        return jsonify({'success': False, 'message': 'No data found'}), 404
+
+    data = [{
+        'date': r.date.strftime('%Y-%m-%d'),
+        'open': r.open_price,
+        'high': r.high_price,
+        'low': r.low_price,
+        'close': r.close_price,
+        'volume': r.volume
+    } for r in records[::-1]]  # chronological order
+
+    return jsonify({'success': True, 'data': {'records': data, 'statistics': stats}})
+
+@stock_bp.route('/stock/predict/<symbol>', methods=['GET'])
+@reads_client_writes
+def predict_stock(symbol):
+    horizon = request.args.get('horizon', 'day')  # 'day', 'month', 'year'
+    result = prediction_service.predict(symbol, horizon)
+    if not result:
+        return jsonify({'success': False, 'message': 'Prediction failed'}), 500
+    return jsonify({'success': True, 'prediction': result})
+
+@stock_bp.route('/stock/stream', methods=['GET'])
+def stream_stock():
+    """Server-Sent Events: new bars and statistics for ?symbols=AAPL,MSFT as they are stored"""
+    symbols = [s.strip() for s in request.args.get('symbols', '').split(',') if s.strip()]
+    days = request.args.get('days', 90, type=int)
+    if not symbols:
+        return jsonify({'success': False, 'message': 'Missing symbols'}), 400
+    allowed_days = current_app.config.get('LIVE_STREAM_DAYS', (90,))
+    if days not in allowed_days:
+        allowed = ', '.join(str(d) for d in allowed_days)
+        return jsonify({'success': False, 'message': f'days must be one of {allowed}'}), 400
+
+    keepalive = current_app.config.get('LIVE_STREAM_KEEPALIVE', 15)
+    subscription = price_broker.get_broker().subscribe(symbols, days)
+
+    def events():
+        try:
+            yield 'retry: 3000\n\n'
+            while not subscription.closed:
+                message = subscription.get(timeout=keepalive)
+                # Comment lines keep proxies from closing an idle stream
+                yield message if message is not None else ': keepalive\n\n'
+        finally:
+            subscription.close()
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
\ No newline at end of file
@@ -0,0 +1,180 @@
+# services/backtest_service.py
+"""
+Walk-forward backtesting of registered predictors over stored history.
+
+Every symbol's closes are loaded in one query (no per-date queries). Every
+day with at least MIN_HISTORY known closes is scored. Its window is the
+history a live predict() call would have seen that day: it expands from
+MIN_HISTORY rows up to the lookback, then rolls. Windows are a strided view
+over the closes left-padded with NaN. A predictor scores all of a symbol's
+windows in a few vectorized calls, and symbols are spread over a process
+pool.
+
+Predictors are looked up by name in prediction_service.PREDICTORS inside
+the worker processes. Custom predictors must be registered when a module
+is imported, not interactively, or spawned workers will not see them.
+"""
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import data_access
+from services import prediction_service
+
+CHUNK_SIZE = 4096  # windows per predictor call, bounds peak memory
+
+def _backtest_symbol(job):
+    """
+    Walk-forward evaluation of one symbol (runs in a worker process)
+    Args:
+        job (tuple): (symbol, closes, predictor, horizon, lookback, seed)
+    Returns:
+        dict: Per-symbol error sums and counts, or None if history is too short
+    """
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    symbol, closes, predictor_name, horizon, lookback, seed = job
+    predictor = prediction_service.PREDICTORS[predictor_name]
+    steps = prediction_service.HORIZON_STEPS[horizon]
+    min_history = prediction_service.MIN_HISTORY
+
+    closes = np.asarray(closes, dtype=float)
+    # Score every day with at least min_history known closes and a known outcome
+    first = min_history - 1
+    last_known = len(closes) - 1 - steps
+    if last_known < first:
+        return None
+
+    started = time.perf_counter()
+    # Expanding windows: left-pad with NaN so row t holds closes[max(0, t - lookback + 1):t + 1],
+    # i.e. exactly the history a live predict() would have seen on day t
+    padded = np.concatenate([np.full(lookback - 1, np.nan), closes])
+    windows = sliding_window_view(padded, lookback)[first:last_known + 1]
+    actual = closes[first + steps:last_known + steps + 1]
+    last = closes[first:last_known + 1]
+    rng = np.random.default_rng([seed, zlib.crc32(symbol.encode('utf-8'))])
+
+    predicted = np.concatenate([
+        np.asarray(predictor(windows[i:i + CHUNK_SIZE], horizon, rng), dtype=float)
+        for i in range(0, len(windows), CHUNK_SIZE)
+    ])
+    elapsed = time.perf_counter() - started
+
+    errors = np.abs(predicted - actual)
+    nonzero = actual != 0
+    # A flat forecast or a flat outcome has no direction; those are ties, not misses
+    predicted_move = np.sign(predicted - last)
+    actual_move = np.sign(actual - last)
+    calls = (predicted_move != 0) & (actual_move != 0)
+    return {
+        'symbol': symbol,
+        'predictions': int(len(predicted)),
+        'abs_error_sum': float(errors.sum()),
+        'ape_sum': float((errors[nonzero] / np.abs(actual[nonzero])).sum()),
+        'ape_count': int(nonzero.sum()),
+        'direction_calls': int(calls.sum()),
+        'direction_hits': int((calls & (predicted_move == actual_move)).sum()),
+        'max_window': int(min(lookback, last_known + 1)),
+        'seconds': elapsed,
+    }
+
+def _metrics(predictions, abs_error_sum, ape_sum, ape_count, direction_calls, direction_hits):
+    return {
+        'predictions': predictions,
+        'mae': round(abs_error_sum / predictions, 4) if predictions else None,
+        'mape': round(ape_sum / ape_count * 100, 4) if ape_count else None,
+        # Over forecasts where both the predicted and the actual move are non-zero
+        'directional_accuracy': round(direction_hits / direction_calls * 100, 2) if direction_calls else None,
+        'direction_ties': predictions - direction_calls,
+    }
+
+def load_histories(symbols=None):
+    """
+    Load every requested symbol's close history in one read
+    Args:
+        symbols (list): Symbols to load (optional, default all stored)
+    Returns:
+        dict: symbol -> list of closes, oldest first
+    """
+    try:
+        histories = data_access.query_close_history(data_access.get_read_session(), symbols)
+        return {symbol: closes for symbol, (_, closes) in histories.items()}
+    finally:
+        data_access.remove_session()
+
+def run_backtest(predictor=prediction_service.DEFAULT_PREDICTOR, horizon='day', symbols=None,
+                 lookback=prediction_service.LOOKBACK_DAYS, workers=None, seed=0, histories=None):
+    """
+    Run a registered predictor walk-forward over stored history
+    Args:
+        predictor (str): Name in prediction_service.PREDICTORS
+        horizon (str): 'day', 'month' or 'year'
+        symbols (list): Symbols to evaluate (optional, default all stored)
+        lookback (int): Maximum rows of history behind each prediction (windows
+                        expand from prediction_service.MIN_HISTORY up to this)
+        workers (int): Process pool size (None = CPU count, 1 = run inline)
+        seed (int): Seed for predictors that use randomness
+        histories (dict): symbol -> closes, to skip the database (optional)
+    Returns:
+        dict: Overall and per-symbol MAE / MAPE (%) / directional accuracy (%,
+              ties excluded and counted separately), the effective window
+              range, skipped symbols (too little history), missing symbols
+              (requested but nothing stored) and throughput in predictions
+              per second
+    """
+    if predictor not in prediction_service.PREDICTORS:
+        raise ValueError(f"Unknown predictor: {predictor}")
+    if horizon not in prediction_service.HORIZON_STEPS:
+        raise ValueError(f"Unknown horizon: {horizon}")
+    if lookback < prediction_service.MIN_HISTORY:
+        raise ValueError(f"lookback must be at least {prediction_service.MIN_HISTORY}")
+
+    started = time.perf_counter()
+    if histories is None:
+        histories = load_histories(symbols)
+    loaded = time.perf_counter()
+    missing = sorted(set(symbols) - set(histories)) if symbols else []
+
+    jobs = [(symbol, closes, predictor, horizon, lookback, seed) for symbol, closes in sorted(histories.items())]
+    if workers == 1 or len(jobs) <= 1:
+        results = [_backtest_symbol(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_backtest_symbol, jobs))
+    finished = time.perf_counter()
+
+    per_symbol = {}
+    skipped = []
+    totals = dict(predictions=0, abs_error_sum=0.0, ape_sum=0.0, ape_count=0, direction_calls=0, direction_hits=0)
+    max_window = 0
+    for job, result in zip(jobs, results):
+        if result is None:
+            skipped.append(job[0])
+            continue
+        counts = {key: result[key] for key in totals}
+        for key, value in counts.items():
+            totals[key] += value
+        max_window = max(max_window, result['max_window'])
+        per_symbol[result['symbol']] = _metrics(**counts)
+        per_symbol[result['symbol']]['window'] = [prediction_service.MIN_HISTORY, result['max_window']]
+        per_symbol[result['symbol']]['predictions_per_second'] = \
+            round(result['predictions'] / result['seconds'], 1) if result['seconds'] else None
+
+    overall = _metrics(**totals)
+    compute_seconds = finished - loaded
+    return {
+        'predictor': predictor,
+        'horizon': horizon,
+        # Effective window sizes actually used (requested lookback caps the maximum)
+        'window': [prediction_service.MIN_HISTORY, max_window] if per_symbol else None,
+        'overall': overall,
+        'symbols': per_symbol,
+        'skipped': skipped,
+        'missing': missing,
+        'timing': {
+            'load_seconds': round(loaded - started, 4),
+            'compute_seconds': round(compute_seconds, 4),
+            'predictions_per_second': round(totals['predictions'] / compute_seconds, 1) if compute_seconds else None,
+        },
+    }
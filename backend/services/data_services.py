@@ -1,8 +1,9 @@
-import yfinance as yf
-from models.stock_data import StockData
-from database import db
+import data_access
+from services import price_broker
 from datetime import datetime, timedelta
-import pandas as pd
+
+# yfinance and data_access.ingest (pandas) are imported inside the functions
+# that need them to keep app startup and stored-data reads light.
 
 def get_historical_data(company_symbol, months=3):
     """
@@ -13,39 +14,8 @@ def get_historical_data(company_symbol, months=3):
     Returns:
         pandas.DataFrame: Historical stock data or None if error
     """
-    try:
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)
-        
-        # Use yfinance Ticker for better error handling
-        ticker = yf.Ticker(company_symbol)
-        
-        # Check if ticker is valid by trying to get info
-        try:
-            info = ticker.info
-            if not info or info.get('regularMarketPrice') is None:
-                print(f"Invalid ticker symbol: {company_symbol}")
-                return None
-        except Exception as e:
-            print(f"Error validating ticker {company_symbol}: {e}")
-            return None
-        
-        # Fetch historical data
-        data = ticker.history(start=start_date, end=end_date)
-        
-        if data.empty:
-            print(f"No data found for symbol: {company_symbol}")
-            return None
-            
-        # Clean the data
-        data = data.dropna()  # Remove any rows with NaN values
-        
-        print(f"Successfully fetched {len(data)} records for {company_symbol}")
-        return data
-        
-    except Exception as e:
-        print(f"Error fetching historical data for {company_symbol}: {e}")
-        return None
+    from data_access import ingest
+    return ingest.fetch_history(company_symbol, months)
 
 def store_stock_data(company_symbol, data):
     """
@@ -60,70 +30,52 @@ def store_stock_data(company_symbol, data):
         print("No data to store")
         return False
     
+    from data_access import ingest
     try:
-        records_added = 0
-        records_updated = 0
-        
-        for index, row in data.iterrows():
-            # Handle volume with proper error checking
-            try:
-                volume_value = row.get('Volume')
-                volume = None if pd.isna(volume_value) else int(volume_value)
-            except (ValueError, TypeError):
-                volume = None
-            
-            # Handle price values with better error checking
-            try:
-                open_price = None if pd.isna(row.get('Open')) else round(float(row.get('Open')), 2)
-                high_price = None if pd.isna(row.get('High')) else round(float(row.get('High')), 2)
-                low_price = None if pd.isna(row.get('Low')) else round(float(row.get('Low')), 2)
-                close_price = None if pd.isna(row.get('Close')) else round(float(row.get('Close')), 2)
-            except (ValueError, TypeError) as e:
-                print(f"Error processing price data for {company_symbol} on {index.date()}: {e}")
-                continue
-            
-            # Skip if all prices are None
-            if all(price is None for price in [open_price, high_price, low_price, close_price]):
-                continue
-            
-            # Check if record already exists
-            existing_record = StockData.query.filter_by(
-                company_symbol=company_symbol,
-                date=index.date()
-            ).first()
-            
-            if existing_record:
-                # Update existing record
-                existing_record.open_price = open_price
-                existing_record.high_price = high_price
-                existing_record.low_price = low_price
-                existing_record.close_price = close_price
-                existing_record.volume = volume
-                existing_record.updated_at = db.func.now()
-                records_updated += 1
-            else:
-                # Create new record
-                stock_record = StockData(
-                    company_symbol=company_symbol,
-                    date=index.date(),
-                    open_price=open_price,
-                    high_price=high_price,
-                    low_price=low_price,
-                    close_price=close_price,
-                    volume=volume
-                )
-                db.session.add(stock_record)
-                records_added += 1
-        
-        db.session.commit()
+        with data_access.session_scope(company_symbol) as session:
+            records_added, records_updated, written_rows = ingest.upsert_stock_data(session, company_symbol, data)
         print(f"Successfully stored {records_added} new records and updated {records_updated} existing records for {company_symbol}")
-        return True
         
     except Exception as e:
-        db.session.rollback()
         print(f"Error storing stock data for {company_symbol}: {e}")
         return False
 
+    publish_stock_update(company_symbol, written_rows)
+    return True
+
+def publish_stock_update(company_symbol, rows):
+    """
+    Push freshly stored bars and statistics to live subscribers
+    Args:
+        company_symbol (str): Stock symbol
+        rows (list): Row dicts the ingest actually inserted or changed
+    Returns:
+        int: Number of subscribers notified
+    """
+    if not rows:
+        return 0
+    broker = price_broker.get_broker()
+    days_wanted = broker.subscribed_days(company_symbol)
+    if not days_wanted:
+        return 0
+
+    try:
+        bars = [{
+            'date': row['date'].strftime('%Y-%m-%d'),
+            'open': row['open_price'],
+            'high': row['high_price'],
+            'low': row['low_price'],
+            'close': row['close_price'],
+            'volume': row['volume']
+        } for row in rows]
+        # One statistics query per window, however many clients share it
+        statistics = {days: get_stock_statistics(company_symbol, days=days) for days in days_wanted}
+        return broker.publish(company_symbol, bars, statistics)
+        
+    except Exception as e:
+        print(f"Error publishing live update for {company_symbol}: {e}")
+        return 0
+
 def get_stored_stock_data(company_symbol, start_date=None, end_date=None, limit=None):
     """
     Retrieve stored stock data from database
@@ -136,19 +88,10 @@ def get_stored_stock_data(company_symbol, start_date=None, end_date=None, limit=
         list: List of StockData objects or None if error
     """
     try:
-        query = StockData.query.filter(StockData.company_symbol == company_symbol)
-        
-        if start_date:
-            query = query.filter(StockData.date >= start_date)
-        if end_date:
-            query = query.filter(StockData.date <= end_date)
-        
-        query = query.order_by(StockData.date.desc())
-        
-        if limit:
-            query = query.limit(limit)
-        
-        return query.all()
+        # Read-only: served by a replica unless this symbol was just written
+        return data_access.query_stock_data(
+            data_access.get_read_session(company_symbol), company_symbol, start_date, end_date, limit
+        )
         
     except Exception as e:
         print(f"Error retrieving stored stock data for {company_symbol}: {e}")
@@ -245,6 +188,7 @@ def get_company_info(company_symbol):
     Returns:
         dict: Company information or None if error
     """
+    import yfinance as yf
     try:
         ticker = yf.Ticker(company_symbol)
         info = ticker.info
@@ -276,6 +220,7 @@ def validate_stock_symbol(company_symbol):
     Returns:
         bool: True if valid, False otherwise
     """
+    import yfinance as yf
     try:
         ticker = yf.Ticker(company_symbol)
         info = ticker.info
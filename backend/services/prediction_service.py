@@ -1,33 +1,83 @@
-import numpy as np
 from services import data_services
 
-def predict(symbol, horizon='day'):
+# Predictors are registered by name and work on a 2-D array of close-price
+# windows (one row per forecast, oldest price first), returning one predicted
+# close per row. predict() passes a single row; the backtester passes every
+# walk-forward window of a symbol at once, left-padded with NaN where fewer
+# than LOOKBACK_DAYS prices were known, so predictors must be NaN-aware.
+PREDICTORS = {}
+
+DEFAULT_PREDICTOR = 'moving_average'
+LOOKBACK_DAYS = 365  # rows of history a prediction sees
+MIN_HISTORY = 60  # fewer rows than this and we refuse to predict
+
+# Trading days between the last known close and the predicted one
+HORIZON_STEPS = {
+    'day': 1,
+    'month': 21,
+    'year': 252,
+}
+
+def register_predictor(name):
+    """Decorator adding a predictor(windows, horizon, rng=None) to the registry"""
+    def decorator(fn):
+        PREDICTORS[name] = fn
+        return fn
+    return decorator
+
+@register_predictor('moving_average')
+def moving_average(windows, horizon='day', rng=None):
     """
-    Predict next day or next month close price using 1 year of historical data.
-    Replace the logic below with a real LSTM model for production.
+    Placeholder model: last N days moving average plus a little noise.
+    Replace with a real LSTM model for production.
+    Args:
+        windows (numpy.ndarray): Close prices, shape (n_forecasts, n_days), NaN-padded on the left
+        horizon (str): 'day', 'month' or 'year'
+        rng: NumPy Generator for the noise (default: global np.random)
+    Returns:
+        numpy.ndarray: Predicted close per window
     """
-    # Get last 1 year (365 days) of data
-    records = data_services.get_stored_stock_data(symbol, limit=365)
-    closes = np.array([r.close_price for r in records if r.close_price is not None])
-
-    if len(closes) < 60:
-        return None
+    import numpy as np
 
-    # Placeholder: Use last N days moving average as prediction
     if horizon == 'day':
-        window = 30
-        pred = closes[-window:].mean() if len(closes) >= window else closes.mean()
+        pred = np.nanmean(windows[:, -30:], axis=1)
     elif horizon == 'month':
-        window = 90
-        pred = closes[-window:].mean() if len(closes) >= window else closes.mean()
+        pred = np.nanmean(windows[:, -90:], axis=1)
     else:
-        pred = closes[-1]
+        pred = windows[:, -1].astype(float)
 
     # Add a small random noise to simulate model uncertainty
-    pred = pred * (1 + np.random.normal(0, 0.01 if horizon == 'day' else 0.03))
+    rng = np.random if rng is None else rng
+    return pred * (1 + rng.normal(0, 0.01 if horizon == 'day' else 0.03, size=len(pred)))
+
+@register_predictor('last_close')
+def last_close(windows, horizon='day', rng=None):
+    """Naive baseline: tomorrow (or next month) closes where today did"""
+    return windows[:, -1].astype(float)
+
+def predict(symbol, horizon='day', predictor=DEFAULT_PREDICTOR):
+    """
+    Predict next day or next month close price using 1 year of historical data.
+    Args:
+        symbol (str): Stock symbol
+        horizon (str): 'day', 'month' or 'year'
+        predictor (str): Name of a registered predictor
+    Returns:
+        dict: Prediction or None if there is not enough data
+    """
+    import numpy as np
+
+    # Get last 1 year (365 days) of data, oldest first
+    records = data_services.get_stored_stock_data(symbol, limit=LOOKBACK_DAYS) or []
+    closes = np.array([r.close_price for r in reversed(records) if r.close_price is not None])
+
+    if len(closes) < MIN_HISTORY:
+        return None
+
+    pred = PREDICTORS[predictor](closes[np.newaxis, :], horizon)[0]
 
     return {
         'symbol': symbol,
         'horizon': horizon,
         'predicted_close': round(float(pred), 2)
-    }
\ No newline at end of file
+    }
@@ -0,0 +1,145 @@
+# services/price_broker.py
+"""
+In-process pub/sub for live price updates (Server-Sent Events).
+
+Each symbol has one channel, the shared publisher for that symbol, however
+many clients subscribe to it. Channels are keyed by the symbol exactly as it
+is stored: 'aapl' and 'AAPL' are separate series with separate statistics. On ingest it forwards exactly the bars that
+ingest inserted or changed. It builds one SSE message per distinct statistics
+window its subscribers asked for and hands the same string to every queue.
+
+The broker lives in the web process. Ingestion has to run in that process
+(POST /stock/fetch) for subscribers to see it. Another broker can be
+installed with set_broker() if it implements subscribe()/subscribed_days()/
+publish().
+"""
+import itertools
+import json
+import queue
+import threading
+
+from config import Config
+
+class Subscription:
+    """A client's view of the broker: a bounded queue of ready-to-send SSE messages"""
+
+    def __init__(self, broker, symbols, days, maxsize):
+        self.broker = broker
+        self.symbols = symbols
+        self.days = days
+        self.closed = False
+        self._queue = queue.Queue(maxsize)
+
+    def deliver(self, message):
+        """Queue a message; a subscriber that falls this far behind is dropped (the client reconnects)"""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            print(f"Dropping lagging live subscriber for {', '.join(self.symbols)}")
+            self.close()
+
+    def get(self, timeout=None):
+        """Return the next message, or None if nothing arrived within timeout"""
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.broker.unsubscribe(self)
+
+class _Channel:
+    """Shared publisher for one symbol"""
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.subscribers = set()
+
+    def days_wanted(self):
+        return {sub.days for sub in self.subscribers}
+
+class LocalBroker:
+    def __init__(self, queue_size=None):
+        self.queue_size = queue_size or Config.LIVE_STREAM_QUEUE_SIZE
+        self._channels = {}
+        self._lock = threading.Lock()
+        self._event_ids = itertools.count(1)
+
+    def subscribe(self, symbols, days=90):
+        """
+        Register a client for one or more symbols
+        Args:
+            symbols (list): Stock symbols
+            days (int): Statistics window the client displays
+        Returns:
+            Subscription: Close it when the client disconnects
+        """
+        symbols = sorted(set(symbols))
+        subscription = Subscription(self, symbols, days, self.queue_size)
+        with self._lock:
+            for symbol in symbols:
+                channel = self._channels.get(symbol)
+                if channel is None:
+                    channel = self._channels[symbol] = _Channel(symbol)
+                channel.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for symbol in subscription.symbols:
+                channel = self._channels.get(symbol)
+                if channel is None:
+                    continue
+                channel.subscribers.discard(subscription)
+                if not channel.subscribers:
+                    del self._channels[symbol]
+
+    def subscribed_days(self, symbol):
+        """Statistics windows wanted for a symbol (empty if nobody is listening)"""
+        with self._lock:
+            channel = self._channels.get(symbol)
+            return channel.days_wanted() if channel else set()
+
+    def publish(self, symbol, bars, statistics_by_days):
+        """
+        Fan out new bars and refreshed statistics to a symbol's subscribers
+        Args:
+            symbol (str): Stock symbol
+            bars (list): Chronological bars (/stock/data format) that were inserted or changed
+            statistics_by_days (dict): days -> statistics dict
+        Returns:
+            int: Number of subscribers notified
+        """
+        with self._lock:
+            channel = self._channels.get(symbol)
+            if channel is None:
+                return 0
+            subscribers = list(channel.subscribers)
+
+        messages = {}
+        for days in {sub.days for sub in subscribers}:
+            payload = json.dumps({
+                'symbol': symbol,
+                'bars': bars,
+                'statistics': statistics_by_days.get(days),
+            })
+            messages[days] = f"id: {next(self._event_ids)}\nevent: bars\ndata: {payload}\n\n"
+
+        for subscription in subscribers:
+            subscription.deliver(messages[subscription.days])
+        return len(subscribers)
+
+_broker = None
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        _broker = LocalBroker()
+    return _broker
+
+def set_broker(broker):
+    """Install a different broker implementation (e.g. one backed by an external service)"""
+    global _broker
+    _broker = broker
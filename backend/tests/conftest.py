@@ -0,0 +1,40 @@
+import os
+import sys
+
+import pytest
+
+# Tests import backend modules the same way app.py does (flat, from backend/)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def make_history():
+    """
+    Factory for yfinance-style daily history frames
+    Args (of the returned function):
+        start (str): First date
+        days (int): Number of daily bars
+        close (float): First close; each later bar closes 1 higher
+    """
+    import numpy as np
+    import pandas as pd
+
+    def make(start, days, close=100.0):
+        index = pd.date_range(start, periods=days, freq='D', tz='America/New_York')
+        closes = close + np.arange(days, dtype=float)
+        return pd.DataFrame({
+            'Open': closes - 0.5, 'High': closes + 1, 'Low': closes - 1, 'Close': closes + 0.004,
+            'Volume': np.full(days, 1000.0),
+        }, index=index)
+    return make
+
+@pytest.fixture
+def primary_db(tmp_path):
+    """Point the data layer at a fresh SQLite file (no replicas) and return its path"""
+    import data_access
+
+    path = tmp_path / 'primary.db'
+    data_access.configure(url=f'sqlite:///{path}', replica_urls=[])
+    data_access.create_all()
+    yield path
+    data_access.remove_session()
+    data_access.get_engine().dispose()
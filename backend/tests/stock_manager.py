@@ -1,40 +1,19 @@
-import yfinance as yf
-import pandas as pd
-from datetime import datetime, timedelta
-from sqlalchemy import create_engine, Column, Integer, String, Float, BigInteger, Date, DateTime, func, UniqueConstraint
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from typing import Optional
+from __future__ import annotations
 
-# SQLAlchemy setup
-Base = declarative_base()
-engine = create_engine('sqlite:///stock_data.db', echo=False)
-Session = sessionmaker(bind=engine)
+import os
+import sys
+from typing import Optional, TYPE_CHECKING
 
-class StockData(Base):
-    __tablename__ = 'stock_data'
-    
-    id = Column(Integer, primary_key=True)
-    company_symbol = Column(String(10), nullable=False)
-    date = Column(Date, nullable=False)
-    open_price = Column(Float)
-    high_price = Column(Float)
-    low_price = Column(Float)
-    close_price = Column(Float)
-    volume = Column(BigInteger)
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
-
-    __table_args__ = (
-        UniqueConstraint('company_symbol', 'date', name='_company_date_uc'),
-    )
+if TYPE_CHECKING:
+    import pandas as pd
 
-    def __repr__(self):
-        return f'<StockData {self.company_symbol} - {self.date}>'
+# Allow running as a script from anywhere: make the backend package importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import data_access
 
 def create_db_model():
     """Create database tables"""
-    Base.metadata.create_all(engine)
+    data_access.create_all()
 
 def fetch_stock_data(symbol: str = "AAPL", months: int = 3) -> Optional[pd.DataFrame]:
     """
@@ -47,55 +26,16 @@ def fetch_stock_data(symbol: str = "AAPL", months: int = 3) -> Optional[pd.DataF
     Returns:
         pd.DataFrame: Stock data or None if fetching fails
     """
-    try:
-        # Calculate date range
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=months * 30)
-        
-        # Download stock data
-        stock = yf.Ticker(symbol)
-        data = stock.history(start=start_date, end=end_date)
-        
-        if data.empty:
-            return None
-        
-        # Reset index to make Date a column
-        data.reset_index(inplace=True)
-        
-        # Add symbol column
-        data['company_symbol'] = symbol
-        
-        # Rename columns to match database schema
-        data.rename(columns={
-            'Date': 'date',
-            'Open': 'open_price',
-            'High': 'high_price',
-            'Low': 'low_price',
-            'Close': 'close_price',
-            'Volume': 'volume'
-        }, inplace=True)
-        
-        # Convert date to date format (remove time component)
-        data['date'] = pd.to_datetime(data['date']).dt.date
-        
-        # Select only the columns we need
-        columns_needed = ['company_symbol', 'date', 'open_price', 'high_price', 'low_price', 'close_price', 'volume']
-        data = data[columns_needed]
-        
-        # Handle NaN values
-        data = data.dropna()
-        
-        return data
-        
-    except Exception as e:
-        print(f"Error fetching stock data: {e}")
-        return None
+    from data_access import ingest
+    # No Ticker.info validation round-trip: this script never made one
+    return ingest.fetch_history(symbol, months, validate=False)
 
-def store_stock_data(data: pd.DataFrame) -> bool:
+def store_stock_data(symbol: str, data: pd.DataFrame) -> bool:
     """
-    Store stock data in database using SQLAlchemy ORM.
+    Store stock data in database using the shared batch upsert.
     
     Args:
+        symbol (str): Stock symbol the data belongs to
         data (pd.DataFrame): Stock data to store
     
     Returns:
@@ -105,52 +45,18 @@ def store_stock_data(data: pd.DataFrame) -> bool:
         print("No data to store")
         return False
     
-    session = Session()
-    
+    from data_access import ingest
     try:
-        records_added = 0
-        records_updated = 0
-        
-        for _, row in data.iterrows():
-            # Check if record already exists
-            existing_record = session.query(StockData).filter_by(
-                company_symbol=row['company_symbol'],
-                date=row['date']
-            ).first()
-            
-            if existing_record:
-                # Update existing record
-                existing_record.open_price = row['open_price']
-                existing_record.high_price = row['high_price']
-                existing_record.low_price = row['low_price']
-                existing_record.close_price = row['close_price']
-                existing_record.volume = row['volume']
-                existing_record.updated_at = func.now()
-                records_updated += 1
-            else:
-                # Create new record
-                stock_record = StockData(
-                    company_symbol=row['company_symbol'],
-                    date=row['date'],
-                    open_price=row['open_price'],
-                    high_price=row['high_price'],
-                    low_price=row['low_price'],
-                    close_price=row['close_price'],
-                    volume=row['volume']
-                )
-                session.add(stock_record)
-                records_added += 1
-        
-        session.commit()
+        with data_access.session_scope(symbol) as session:
+            records_added, records_updated, _ = ingest.upsert_stock_data(session, symbol, data)
         print(f"Successfully processed {records_added} new records and updated {records_updated} existing records")
         return True
         
     except Exception as e:
-        session.rollback()
         print(f"Error storing data: {e}")
         return False
     finally:
-        session.close()
+        data_access.remove_session()
 
 def print_stock_data(symbol: str = "AAPL", limit: int = None, sort_by_date: bool = True):
     """
@@ -161,21 +67,11 @@ def print_stock_data(symbol: str = "AAPL", limit: int = None, sort_by_date: bool
         limit (int): Maximum number of records to display (None for all)
         sort_by_date (bool): Sort by date (newest first if True)
     """
-    session = Session()
+    session = data_access.get_read_session(symbol)
     
     try:
-        # Build query
-        query = session.query(StockData).filter_by(company_symbol=symbol)
-        
-        # Sort by date
-        if sort_by_date:
-            query = query.order_by(StockData.date.desc())
-        
-        # Apply limit
-        if limit:
-            query = query.limit(limit)
-        
-        records = query.all()
+        # Newest first, or the first `limit` rows in insertion order
+        records = data_access.query_stock_data(session, symbol, limit=limit, newest_first=sort_by_date)
         
         if not records:
             print(f"No data found for symbol: {symbol}")
@@ -222,7 +118,7 @@ def print_stock_data(symbol: str = "AAPL", limit: int = None, sort_by_date: bool
     except Exception as e:
         print(f"Error retrieving data: {e}")
     finally:
-        session.close()
+        data_access.remove_session()
 
 def print_all_symbols(limit_per_symbol: int = 5):
     """
@@ -231,12 +127,11 @@ def print_all_symbols(limit_per_symbol: int = 5):
     Args:
         limit_per_symbol (int): Number of recent records to show per symbol
     """
-    session = Session()
+    session = data_access.get_read_session()
     
     try:
         # Get all unique symbols
-        symbols = session.query(StockData.company_symbol).distinct().all()
-        symbols = [s[0] for s in symbols]
+        symbols = data_access.list_symbols(session)
         
         if not symbols:
             print("No stock data found in database")
@@ -253,7 +148,7 @@ def print_all_symbols(limit_per_symbol: int = 5):
     except Exception as e:
         print(f"Error retrieving symbols: {e}")
     finally:
-        session.close()
+        data_access.remove_session()
 
 def main():
     """Main function to orchestrate the stock data download and storage process."""
@@ -274,7 +169,7 @@ def main():
         
         # Step 3: Store data in database
         print("Storing data in database...")
-        success = store_stock_data(stock_data)
+        success = store_stock_data("AAPL", stock_data)
         
         if success:
             print("Process completed successfully!")
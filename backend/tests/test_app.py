@@ -0,0 +1,37 @@
+from datetime import date
+
+import data_access
+from app import create_app
+from config import Config
+from database import db
+
+def _app(path, close):
+    """App on its own SQLite file holding one AAPL row at the given close"""
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        DATABASE_REPLICA_URLS = []
+
+    app = create_app(TestConfig)
+    with app.app_context():
+        db.create_all()
+        data_access.create_all()
+        with data_access.session_scope('AAPL') as session:
+            session.add(data_access.StockData(company_symbol='AAPL', date=date(2026, 1, 2), close_price=close))
+    return app
+
+def test_apps_keep_their_own_data_layer(tmp_path):
+    first = _app(tmp_path / 'a.db', 100.0)
+    second = _app(tmp_path / 'b.db', 200.0)
+
+    for app, close in ((first, 100.0), (second, 200.0)):
+        response = app.test_client().get('/stock/data/AAPL')
+        assert response.status_code == 200
+        assert response.get_json()['data']['records'][0]['close'] == close
+        with app.app_context():
+            assert data_access.get_engine() is db.engine
+
+def test_outside_an_app_context_uses_the_default_layer(primary_db, tmp_path):
+    app = _app(tmp_path / 'app.db', 100.0)
+
+    assert data_access.get_engine().url.database == str(primary_db)
+    assert app.extensions['data_access'].engine.url.database == str(tmp_path / 'app.db')
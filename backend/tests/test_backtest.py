@@ -0,0 +1,81 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+import data_access
+from services import backtest_service, prediction_service
+
+def _closes(n, seed=0):
+    return list(100 + np.cumsum(np.random.default_rng(seed).normal(size=n)))
+
+@pytest.fixture
+def mean30(monkeypatch):
+    """Noise-free 30-day mean so results can be checked exactly"""
+    def predictor(windows, horizon='day', rng=None):
+        return np.nanmean(windows[:, -30:], axis=1)
+    monkeypatch.setitem(prediction_service.PREDICTORS, 'mean30', predictor)
+    return 'mean30'
+
+def test_short_histories_are_walked_forward():
+    report = backtest_service.run_backtest(
+        'last_close', 'day', workers=1, histories={'MSFT': _closes(300), 'TINY': _closes(60)}
+    )
+    # Every day with >= MIN_HISTORY prior closes and a known next close
+    assert report['symbols']['MSFT']['predictions'] == 300 - 1 - prediction_service.MIN_HISTORY + 1
+    assert report['symbols']['MSFT']['window'] == [60, 299]
+    assert report['skipped'] == ['TINY']
+
+def test_requested_symbols_without_history_are_reported(primary_db):
+    with data_access.session_scope() as session:
+        for i, close in enumerate(_closes(80)):
+            session.add(data_access.StockData(
+                company_symbol='AAA', date=date(2026, 1, 1) + timedelta(days=i), close_price=close))
+
+    report = backtest_service.run_backtest('last_close', 'day', symbols=['AAA', 'ZZZ'], workers=1)
+    assert list(report['symbols']) == ['AAA']
+    assert report['missing'] == ['ZZZ']
+    assert report['skipped'] == []
+
+def test_year_horizon_scores_every_eligible_day():
+    report = backtest_service.run_backtest('last_close', 'year', workers=1, histories={'AAPL': _closes(600)})
+    assert report['symbols']['AAPL']['predictions'] == 600 - 252 - 60 + 1
+    assert report['window'] == [60, 348]
+
+def test_matches_per_date_live_windows(mean30):
+    closes = np.array(_closes(500, seed=3))
+    report = backtest_service.run_backtest(mean30, 'day', workers=1, histories={'AAPL': list(closes)})
+
+    errors = []
+    for t in range(59, len(closes) - 1):
+        history = closes[max(0, t - 364):t + 1]  # what predict() would load on day t
+        errors.append(abs(history[-30:].mean() - closes[t + 1]))
+    assert report['symbols']['AAPL']['predictions'] == len(errors)
+    assert report['symbols']['AAPL']['mae'] == pytest.approx(np.mean(errors), abs=1e-4)
+    assert report['window'] == [60, 365]
+
+def test_flat_forecasts_are_ties_not_misses():
+    report = backtest_service.run_backtest('last_close', 'day', workers=1, histories={'AAPL': _closes(200)})
+    overall = report['overall']
+    assert overall['directional_accuracy'] is None
+    assert overall['direction_ties'] == overall['predictions']
+
+def test_directional_accuracy_excludes_flat_outcomes(mean30):
+    closes = [100.0] * 80 + [99.0, 101.0, 102.0]
+    report = backtest_service.run_backtest(mean30, 'day', workers=1, histories={'AAPL': closes})
+    # Flat forecasts over the flat stretch are ties. From 99 the lagging mean
+    # calls "up" (hit); from 101 it calls "down" while the price rises (miss).
+    overall = report['overall']
+    assert overall['predictions'] == 83 - 1 - 59
+    assert overall['direction_ties'] == overall['predictions'] - 2
+    assert overall['directional_accuracy'] == 50.0
+
+def test_process_pool_matches_inline():
+    histories = {s: _closes(400 + 50 * i, seed=i) for i, s in enumerate(['A', 'B', 'C'])}
+    inline = backtest_service.run_backtest('moving_average', 'month', workers=1, seed=7, histories=histories)
+    pooled = backtest_service.run_backtest('moving_average', 'month', workers=2, seed=7, histories=histories)
+    assert pooled['overall'] == inline['overall']
+
+def test_rejects_lookback_below_min_history():
+    with pytest.raises(ValueError):
+        backtest_service.run_backtest('last_close', lookback=10, histories={})
@@ -0,0 +1,116 @@
+import os
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+
+from config import Config
+from data_access import fetch_cache
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, 'FETCH_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MODE', 'live')
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MAX_BYTES', 10 * 1024 * 1024)
+    monkeypatch.setattr(Config, 'FETCH_CACHE_LIVE_TTL', 60)
+    monkeypatch.setattr(Config, 'FETCH_CACHE_HISTORICAL_TTL', 3600)
+    return tmp_path / 'cache'
+
+def _frame(start, days):
+    index = pd.date_range(start, periods=days, freq='D', tz='America/New_York')
+    return pd.DataFrame({'Close': range(days)}, index=index)
+
+def _later(monkeypatch, seconds):
+    now = time.time() + seconds
+    monkeypatch.setattr(fetch_cache.time, 'time', lambda: now)
+
+def _stub_loader(result):
+    calls = []
+    def loader():
+        calls.append(1)
+        return result
+    return loader, calls
+
+def test_live_range_uses_short_ttl(monkeypatch):
+    today = date.today()
+    fetch_cache.put('AAPL', today - timedelta(days=30), today + timedelta(days=1), 'live')
+
+    assert fetch_cache.get('AAPL', today - timedelta(days=30), today + timedelta(days=1)) == 'live'
+    _later(monkeypatch, 61)
+    assert fetch_cache.get('AAPL', today - timedelta(days=30), today + timedelta(days=1)) is None
+
+def test_closed_range_uses_historical_ttl(monkeypatch):
+    today = date.today()
+    start, end = today - timedelta(days=60), today - timedelta(days=10)
+    fetch_cache.put('AAPL', start, end, 'closed')
+
+    _later(monkeypatch, 61)
+    assert fetch_cache.get('AAPL', start, end) == 'closed'
+    _later(monkeypatch, 3601)
+    assert fetch_cache.get('AAPL', start, end) is None
+
+def test_fetch_calls_loader_once():
+    loader, calls = _stub_loader({'rows': 3})
+    args = ('MSFT', date(2026, 1, 1), date(2026, 2, 1))
+
+    assert fetch_cache.fetch(*args, loader) == {'rows': 3}
+    assert fetch_cache.fetch(*args, loader) == {'rows': 3}
+    assert len(calls) == 1
+
+def test_lru_eviction_keeps_recently_used(monkeypatch):
+    payload = 'x' * 1000
+    days = [date(2026, 1, d) for d in range(1, 5)]
+    for i, day in enumerate(days):
+        fetch_cache.put('S%d' % i, day, day + timedelta(days=1), payload)
+    entry_size = max(size for _, size, _ in fetch_cache._iter_entries())
+
+    # Make S0 the most recently used, then shrink the budget to two entries
+    for i, (path, _, _) in enumerate(sorted(fetch_cache._iter_entries())):
+        os.utime(path, (1000 + i, 1000 + i))
+    assert fetch_cache.get('S0', days[0], days[0] + timedelta(days=1)) == payload
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MAX_BYTES', entry_size * 3 - 1)
+    fetch_cache.put('S4', date(2026, 1, 5), date(2026, 1, 6), payload)
+
+    assert fetch_cache.get('S0', days[0], days[0] + timedelta(days=1)) == payload
+    assert fetch_cache.get('S4', date(2026, 1, 5), date(2026, 1, 6)) == payload
+    assert fetch_cache.get('S1', days[1], days[1] + timedelta(days=1)) is None
+    assert sum(size for _, size, _ in fetch_cache._iter_entries()) <= entry_size * 3 - 1
+
+def test_failed_write_leaves_no_temp_file(cache_dir):
+    assert fetch_cache.put('AAPL', date(2026, 1, 1), date(2026, 2, 1), lambda: None) is False
+    leftovers = [n for _, _, names in os.walk(cache_dir) for n in names]
+    assert leftovers == []
+
+def test_replay_serves_covered_range_on_a_later_day(monkeypatch):
+    recorded = _frame('2026-01-01', 100)
+    fetch_cache.fetch('AAPL', date(2026, 1, 1), date(2026, 4, 11), lambda: recorded)
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MODE', 'replay')
+    _later(monkeypatch, 86400)
+    loader, calls = _stub_loader(None)
+
+    # A closed range inside the recording gets exactly [start, end)
+    data = fetch_cache.fetch('AAPL', date(2026, 2, 2), date(2026, 3, 1), loader)
+    assert calls == []
+    assert len(data) == 27
+    assert (data.index[0].date(), data.index[-1].date()) == (date(2026, 2, 2), date(2026, 2, 28))
+    assert len(fetch_cache.fetch('AAPL', date(2026, 1, 1), date(2026, 2, 1), loader)) == 31
+
+def test_replay_partial_cover_is_a_miss(monkeypatch):
+    fetch_cache.fetch('AAPL', date(2026, 1, 1), date(2026, 4, 11), lambda: _frame('2026-01-01', 100))
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MODE', 'replay')
+    loader, calls = _stub_loader(_frame('2026-01-01', 10))
+
+    # The range runs past the recorded end: the live request would have seen more rows
+    assert fetch_cache.fetch('AAPL', date(2026, 2, 2), date(2026, 4, 12), loader) is None
+    assert calls == []
+
+def test_replay_miss_never_calls_loader(monkeypatch):
+    fetch_cache.fetch('AAPL', date(2026, 2, 1), date(2026, 3, 1), lambda: _frame('2026-02-01', 28))
+    monkeypatch.setattr(Config, 'FETCH_CACHE_MODE', 'replay')
+    loader, calls = _stub_loader(_frame('2026-01-01', 10))
+
+    # Unknown symbol, and a window starting before anything recorded
+    assert fetch_cache.fetch('MSFT', date(2026, 2, 1), date(2026, 3, 1), loader) is None
+    assert fetch_cache.fetch('AAPL', date(2026, 1, 1), date(2026, 3, 1), loader) is None
+    assert calls == []
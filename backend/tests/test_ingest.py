@@ -0,0 +1,49 @@
+import numpy as np
+
+import data_access
+from data_access import ingest
+
+def test_clean_history_rounds_and_drops_empty_rows(make_history):
+    data = make_history('2026-01-01', 3)
+    data.iloc[1, :4] = np.nan
+
+    rows = ingest.clean_history('AAPL', data)
+
+    assert [str(r['date']) for r in rows] == ['2026-01-01', '2026-01-03']
+    assert rows[0]['close_price'] == 100.0
+    assert rows[0]['volume'] == 1000
+
+def test_upsert_counts_new_and_updated_rows(primary_db, make_history):
+    with data_access.session_scope('AAPL') as session:
+        added, updated, written = ingest.upsert_stock_data(session, 'AAPL', make_history('2026-01-01', 5))
+    assert (added, updated, len(written)) == (5, 0, 5)
+    with data_access.session_scope('AAPL') as session:
+        added, updated, written = ingest.upsert_stock_data(session, 'AAPL', make_history('2026-01-04', 4, close=200.0))
+    assert (added, updated) == (2, 2)
+    assert [str(row['date']) for row in written] == ['2026-01-04', '2026-01-05', '2026-01-06', '2026-01-07']
+
+    records = data_access.query_stock_data(data_access.get_session(), 'AAPL')
+    assert len(records) == 7
+    assert str(records[0].date) == '2026-01-07'
+    assert records[-4].close_price == 200.0  # 2026-01-04 was overwritten
+
+def test_upsert_skips_unchanged_rows(primary_db, make_history):
+    data = make_history('2026-01-01', 5)
+    with data_access.session_scope('AAPL') as session:
+        ingest.upsert_stock_data(session, 'AAPL', data)
+    revised = data.copy()
+    revised.iloc[-1, revised.columns.get_loc('Close')] += 1
+
+    with data_access.session_scope('AAPL') as session:
+        assert ingest.upsert_stock_data(session, 'AAPL', data) == (0, 0, [])
+        added, updated, written = ingest.upsert_stock_data(session, 'AAPL', revised)
+    assert (added, updated) == (0, 1)
+    assert [str(row['date']) for row in written] == ['2026-01-05']
+
+def test_query_insertion_order(primary_db, make_history):
+    with data_access.session_scope('AAPL') as session:
+        ingest.upsert_stock_data(session, 'AAPL', make_history('2026-02-01', 3))
+        ingest.upsert_stock_data(session, 'AAPL', make_history('2026-01-01', 3))
+
+    records = data_access.query_stock_data(data_access.get_session(), 'AAPL', limit=2, newest_first=False)
+    assert [str(r.date) for r in records] == ['2026-02-01', '2026-02-02']
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from services import data_services, price_broker
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = price_broker.LocalBroker(queue_size=10)
+    monkeypatch.setattr(price_broker, '_broker', broker)
+    return broker
+
+def _event(subscription):
+    message = subscription.get(timeout=0)
+    assert message is not None
+    return json.loads(message.split('data: ', 1)[1])
+
+def test_one_message_shared_per_window(broker):
+    a = broker.subscribe(['AAPL'], days=30)
+    b = broker.subscribe(['AAPL'], days=30)
+    c = broker.subscribe(['AAPL', 'MSFT'], days=90)
+
+    assert broker.subscribed_days('AAPL') == {30, 90}
+    bars = [{'date': '2026-01-0%d' % d, 'close': d} for d in (1, 2, 3)]
+    assert broker.publish('AAPL', bars, {30: {'w': 30}, 90: {'w': 90}}) == 3
+
+    first, second = a.get(timeout=0), b.get(timeout=0)
+    assert first is second
+    assert _event(c)['statistics'] == {'w': 90}
+    assert json.loads(first.split('data: ', 1)[1])['bars'] == bars
+
+def test_unsubscribe_and_lagging_client_dropped(broker):
+    slow = broker.subscribe(['AAPL'], days=30)
+    for _ in range(11):
+        broker.publish('AAPL', [], {})
+    assert slow.closed
+    assert broker.subscribed_days('AAPL') == set()
+
+def test_store_pushes_every_inserted_bar_then_only_changes(primary_db, broker, make_history):
+    subscription = broker.subscribe(['AAPL'], days=30)
+
+    # Several bars at once (e.g. after a weekend): all of them are pushed
+    assert data_services.store_stock_data('AAPL', make_history('2026-01-01', 4))
+    assert [bar['date'] for bar in _event(subscription)['bars']] == \
+        ['2026-01-01', '2026-01-02', '2026-01-03', '2026-01-04']
+
+    # Re-ingesting identical data pushes nothing; a revised last bar pushes just that bar
+    assert data_services.store_stock_data('AAPL', make_history('2026-01-01', 4))
+    assert subscription.get(timeout=0) is None
+    revised = make_history('2026-01-01', 5)
+    revised.iloc[-2, revised.columns.get_loc('Close')] = 150.0
+    data_services.store_stock_data('AAPL', revised)
+    assert [(bar['date'], bar['close']) for bar in _event(subscription)['bars']] == \
+        [('2026-01-04', 150.0), ('2026-01-05', 104.0)]
+
+def test_symbols_are_matched_exactly(primary_db, broker, make_history):
+    subscription = broker.subscribe(['AAPL'], days=30)
+
+    # A lower-case fetch is its own stored series; it must not reach AAPL subscribers
+    assert data_services.store_stock_data('aapl', make_history('2026-01-01', 2))
+    assert subscription.get(timeout=0) is None
+    assert broker.subscribed_days('aapl') == set()
+
+def test_stream_rejects_unlisted_windows(primary_db, tmp_path):
+    from app import create_app
+    from config import Config
+
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{tmp_path / "app.db"}'
+        DATABASE_REPLICA_URLS = []
+
+    client = create_app(TestConfig).test_client()
+    response = client.get('/stock/stream?symbols=AAPL&days=45')
+    assert response.status_code == 400
+    assert client.get('/stock/stream').status_code == 400
@@ -0,0 +1,109 @@
+import shutil
+import time
+from datetime import date
+
+import pytest
+
+import data_access
+from config import Config
+from data_access import engine as data_engine
+
+def _add_row(session, symbol='AAPL', price=100.0):
+    session.add(data_access.StockData(company_symbol=symbol, date=date(2026, 1, 2), close_price=price))
+
+@pytest.fixture
+def replicated(tmp_path, monkeypatch):
+    """Primary SQLite file plus two replicas that are plain file copies of it"""
+    primary = tmp_path / 'primary.db'
+    replicas = [tmp_path / 'replica1.db', tmp_path / 'replica2.db']
+    data_access.configure(url=f'sqlite:///{primary}', replica_urls=[])
+    data_access.create_all()
+    data_access.get_engine().dispose()
+    for replica in replicas:
+        shutil.copy(primary, replica)
+
+    monkeypatch.setattr(Config, 'REPLICA_READ_AFTER_WRITE_SECONDS', 5)
+    data_access.configure(url=f'sqlite:///{primary}', replica_urls=[f'sqlite:///{r}' for r in replicas])
+    yield primary, replicas
+    data_access.remove_session()
+
+def _database(session):
+    return session.get_bind().url.database
+
+def test_reads_go_to_replicas_round_robin(replicated):
+    primary, replicas = replicated
+
+    first = data_access.get_read_session('AAPL')
+    assert isinstance(first, data_access.engine.ReplicaSession)
+    assert _database(first) == str(replicas[0])
+    assert _database(data_access.get_read_session('AAPL')) == str(replicas[0])  # pinned per session
+
+    data_access.remove_session()
+    assert _database(data_access.get_read_session('AAPL')) == str(replicas[1])
+    assert _database(data_access.get_session()) == str(primary)
+
+def test_read_your_writes_then_stale_replica(replicated, monkeypatch):
+    with data_access.session_scope('AAPL') as session:
+        _add_row(session)
+    data_access.remove_session()
+
+    # Within the window the symbol is read from the primary
+    reads = data_access.query_stock_data(data_access.get_read_session('AAPL'), 'AAPL')
+    assert [r.close_price for r in reads] == [100.0]
+    # Other symbols already go to the (stale) replica
+    assert isinstance(data_access.get_read_session('MSFT'), data_engine.ReplicaSession)
+    data_access.remove_session()
+
+    # After the window, reads move to the replica, which has not caught up
+    later = time.monotonic() + 6
+    monkeypatch.setattr(data_engine.time, 'monotonic', lambda: later)
+    session = data_access.get_read_session('AAPL')
+    assert isinstance(session, data_engine.ReplicaSession)
+    assert data_access.query_stock_data(session, 'AAPL') == []
+
+def test_unkeyed_write_routes_every_read_to_primary(replicated):
+    with data_access.session_scope() as session:
+        _add_row(session, symbol='MSFT')
+    assert not isinstance(data_access.get_read_session('AAPL'), data_engine.ReplicaSession)
+
+def test_replica_session_refuses_to_flush(replicated):
+    session = data_access.get_read_session('AAPL')
+    _add_row(session)
+    with pytest.raises(RuntimeError):
+        session.flush()
+    session.rollback()
+    # Plain primary sessions are unaffected
+    with data_access.session_scope('AAPL') as primary_session:
+        _add_row(primary_session)
+
+def test_no_replicas_reads_primary(primary_db):
+    session = data_access.get_read_session('AAPL')
+    assert not isinstance(session, data_engine.ReplicaSession)
+    assert _database(session) == str(primary_db)
+
+def test_write_marker_carries_read_your_writes_across_workers(replicated, monkeypatch, make_history):
+    from app import create_app
+    from services import data_services
+    primary, replicas = replicated
+
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{primary}'
+        DATABASE_REPLICA_URLS = [f'sqlite:///{r}' for r in replicas]
+
+    monkeypatch.setattr(data_services, 'get_historical_data', lambda symbol, months: make_history('2026-01-01', 5))
+    # Two apps stand in for two worker processes: they share no write marks
+    fetching, reading = create_app(TestConfig).test_client(), create_app(TestConfig).test_client()
+
+    fetched = fetching.post('/stock/fetch', json={'symbol': 'AAPL'})
+    assert fetched.status_code == 200
+    marker = fetched.headers['X-Stock-Written']
+    assert marker.startswith('AAPL=')
+
+    # Without the marker the other worker reads a replica that has not caught up
+    assert reading.get('/stock/data/AAPL').status_code == 404
+    response = reading.get('/stock/data/AAPL', headers={'X-Stock-Written': marker})
+    assert response.status_code == 200
+    assert len(response.get_json()['data']['records']) == 5
+    # A marker for another symbol, or an expired one, does not move the read
+    assert reading.get('/stock/data/AAPL', headers={'X-Stock-Written': 'MSFT=' + marker[5:]}).status_code == 404
+    assert reading.get('/stock/data/AAPL', headers={'X-Stock-Written': 'AAPL=1000'}).status_code == 404
@@ -69,12 +69,15 @@ const handleSearch = async () => {
     if (fetchRes.data.success) {
       console.log(`Successfully fetched and stored data for ${trimmedSymbol}`);
       
-      // Then, get the stored data for display
+      // Then, get the stored data for display. Passing the write marker back
+      // makes whichever server worker answers read it from the primary database.
+      const writeMarker = fetchRes.headers['x-stock-written'];
       const getRes = await axios.get(`http://127.0.0.1:5000/stock/data/${trimmedSymbol}`, {
-        params: { 
+        params: {
           limit: 90, // Get last 90 days of data
           days: 90
-        }
+        },
+        headers: writeMarker ? { 'X-Stock-Written': writeMarker } : {}
       });
 
       if (getRes.data.success && getRes.data.data.records.length > 0) {
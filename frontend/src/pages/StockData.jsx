@@ -37,6 +37,14 @@ function formatDate(date) {
   return format(date, "MMM dd");
 }
 
+// Merge streamed bars into the chart records: replace bars for known dates,
+// append new ones, keep the most recent `limit` in chronological order.
+function mergeBars(records, bars, limit) {
+  const byDate = new Map(records.map((r) => [r.date.toISOString().slice(0, 10), r]));
+  bars.forEach((b) => byDate.set(b.date, { ...b, date: new Date(b.date) }));
+  return [...byDate.values()].sort((a, b) => a.date - b.date).slice(-limit);
+}
+
 function StockData({ width = 900, ratio = 1 }) {
   const location = useLocation();
   const initialSymbol = location.state?.symbol || "AAPL";
@@ -88,6 +96,22 @@ function StockData({ width = 900, ratio = 1 }) {
     fetchData();
   }, [symbol, duration]);
 
+  // Live updates: the server pushes new bars and statistics when it stores them
+  useEffect(() => {
+    const source = new EventSource(
+      `http://127.0.0.1:5000/stock/stream?symbols=${encodeURIComponent(symbol)}&days=${duration}`
+    );
+    source.addEventListener("bars", (e) => {
+      const update = JSON.parse(e.data);
+      if (update.symbol !== symbol.toUpperCase()) return;
+      if (update.bars.length > 0) {
+        setRecords((prev) => mergeBars(prev, update.bars, duration));
+      }
+      if (update.statistics) setStatistics(update.statistics);
+    });
+    return () => source.close();
+  }, [symbol, duration]);
+
   const handleSearch = async (e) => {
     e.preventDefault();
     if (!search.trim()) return;